@@ -6,8 +6,16 @@ For higher quality, replace with an LLM classification call or a small keyword m
 """
 
 import os
+import re
 import random
-from typing import List
+from functools import lru_cache
+from typing import List, Optional
+
+# optional C-backed Aho-Corasick automaton (falls back to per-category regexes)
+try:
+    import ahocorasick
+except Exception:
+    ahocorasick = None
 
 USE_MOCK = os.getenv("USE_MOCK", "true").lower() in ("1", "true", "yes")
 
@@ -23,40 +31,71 @@ CATEGORIES = [
 ]
 
 
-def categorize_article(title: str, snippet: str) -> str:
-    """
-    Return a category string. In mock mode, uses simple keyword matching
-    and falls back to a random valid category to avoid uncategorized items.
-    """
-    if USE_MOCK:
-        lower = (title or "").lower() + " " + (snippet or "").lower()
+# Keyword stems per category, in priority order (first match wins).
+# "world" is checked last as the geopolitics fallback.
+CATEGORY_KEYWORDS = {
+    "business": ["market", "econom", "stock", "business", "trade", "invest"],
+    "tech": ["ai", "tech", "sdk", "software", "developer", "chip", "semiconductor", "app", "startup"],
+    "sports": ["football", "cricket", "tournament", "goal", "match", "penalt", "nba", "fifa", "olympic"],
+    "health": ["health", "flu", "vaccin", "hospital", "covid", "disease", "medical"],
+    "science": ["science", "research", "battery", "study", "quantum", "space", "experiment"],
+    "entertainment": ["film", "movie", "concert", "celebr", "music", "series", "bollywood", "hollywood"],
+    "india": ["india", "delhi", "mumbai", "bangalore", "karnataka", "modi", "parliament"],
+    "world": ["war", "election", "government", "president", "minister", "united nations", "eu", "china", "russia"],
+}
 
-        if any(w in lower for w in ["market", "econom", "stock", "business", "trade", "invest"]):
-            return "business"
+# One precompiled alternation per category; matching stays substring-based
+# (same as the old `w in lower` checks) so stems like "econom" keep working.
+_CATEGORY_PATTERNS = [
+    (cat, re.compile("|".join(re.escape(w) for w in words), re.IGNORECASE))
+    for cat, words in CATEGORY_KEYWORDS.items()
+]
+_CATEGORY_ORDER = list(CATEGORY_KEYWORDS)
 
-        if any(w in lower for w in ["ai", "tech", "sdk", "software", "developer", "chip", "semiconductor", "app", "startup"]):
-            return "tech"
 
-        if any(w in lower for w in ["football", "cricket", "tournament", "goal", "match", "penalt", "nba", "fifa", "olympic"]):
-            return "sports"
+def _build_automaton():
+    """Build a single Aho-Corasick automaton over every keyword.
+    Values are category priority ranks so one pass can pick the winner."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for rank, words in enumerate(CATEGORY_KEYWORDS.values()):
+        for w in words:
+            # keep the highest-priority category if a keyword is listed twice
+            if automaton.get(w, rank) >= rank:
+                automaton.add_word(w, rank)
+    automaton.make_automaton()
+    return automaton
 
-        if any(w in lower for w in ["health", "flu", "vaccin", "hospital", "covid", "disease", "medical"]):
-            return "health"
 
-        if any(w in lower for w in ["science", "research", "battery", "study", "quantum", "space", "experiment"]):
-            return "science"
+_AUTOMATON = _build_automaton()
 
-        if any(w in lower for w in ["film", "movie", "concert", "celebr", "music", "series", "bollywood", "hollywood"]):
-            return "entertainment"
 
-        if any(w in lower for w in ["india", "delhi", "mumbai", "bangalore", "karnataka", "modi", "parliament"]):
-            return "india"
+@lru_cache(maxsize=8192)
+def _keyword_category(title: str, snippet: str) -> Optional[str]:
+    """First category whose keywords appear in title/snippet, or None (memoized)."""
+    text = f"{title or ''} {snippet or ''}"
 
-        # default: "world" if obviously geopolitics, else random for variety
-        if any(w in lower for w in ["war", "election", "government", "president", "minister", "united nations", "eu", "china", "russia"]):
-            return "world"
+    if _AUTOMATON is not None:
+        # single linear scan; lowest rank among all hits wins
+        best = min((rank for _, rank in _AUTOMATON.iter(text.lower())), default=None)
+        return _CATEGORY_ORDER[best] if best is not None else None
+    for cat, pat in _CATEGORY_PATTERNS:
+        if pat.search(text):
+            return cat
+    return None
 
-        return random.choice(CATEGORIES)
+
+def categorize_article(title: str, snippet: str) -> str:
+    """
+    Return a category string. In mock mode, uses simple keyword matching
+    and falls back to a random valid category to avoid uncategorized items.
+    Keyword hits are memoized per (title, snippet); the random fallback is not,
+    so a miss still gets a fresh pick each call.
+    """
+    if USE_MOCK:
+        # no keyword hit: random for variety
+        return _keyword_category(title, snippet) or random.choice(CATEGORIES)
     else:
         # TODO: Replace with LLM classifier or ML model
         raise NotImplementedError(
@@ -8,9 +8,9 @@ Usage:
 """
 
 import argparse
-import json
 from app.coordinator import generate_briefing
 from app.memory.memory_bank import load_memory, update_preferences, add_feedback
+from app.utils import dumps
 
 def _parse_args():
     p = argparse.ArgumentParser(prog="news-briefing-cli")
@@ -36,11 +36,11 @@ def run():
         elif args.category:
             cats = [args.category.strip()]
         briefing = generate_briefing(top_n=args.num, categories=cats)
-        print(json.dumps(briefing, indent=2))
+        print(dumps(briefing, indent=True))
     elif args.cmd == "prefs":
         mem = load_memory()
         if args.action == "show":
-            print(json.dumps(mem.get("user_prefs", {}), indent=2))
+            print(dumps(mem.get("user_prefs", {}), indent=True))
         elif args.action == "add" and args.category:
             update_preferences(add_category=args.category.strip())
             print("Added category:", args.category)
@@ -10,13 +10,13 @@ This version:
 
 from typing import List, Optional
 import time
-import random
+import heapq
 import logging
 
-from tools.rss_fetcher import fetch_rss, SUPPORTED_CATEGORIES
-from summarizer_agent import call_gemini_summarize
+from tools.rss_fetcher import fetch_rss_many, SUPPORTED_CATEGORIES
+from summarizer_agent import summarize_batch
 from categorizer_agent import categorize_article
-from memory.memory_bank import load_memory, save_memory
+from memory.memory_bank import edit_memory
 from observability.logger import log_event
 from observability.traces import new_trace, add_step, end_trace
 from utils import fingerprint_article
@@ -24,15 +24,93 @@ from utils import fingerprint_article
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# O(1) membership for category normalization (the list stays ordered for sampling)
+_SUPPORTED = frozenset(SUPPORTED_CATEGORIES)
+
+
+def _fetch_categories(cats: List[str], num: int) -> List[dict]:
+    """
+    Fetch all categories in a single fan-out over every feed URL
+    (network-bound; latency tracks the slowest feed).
+    Each article is annotated with the category it was fetched for.
+    """
+    collected = []
+    if not cats:
+        return collected
+
+    try:
+        by_cat = fetch_rss_many(cats, num=num)
+    except Exception as e:
+        logger.warning("fetch_rss_many error for %s: %s", cats, e)
+        return collected
+
+    for c in cats:
+        arts = by_cat.get(c.lower(), [])
+        # annotate category at source level
+        for a in arts:
+            a.setdefault("category", c)
+        collected.extend(arts)
+    return collected
+
+
+def _best_first(r: dict):
+    # confidence (desc), then freshest first (short summaries share one confidence value)
+    return (-float(r.get("confidence", 0.0)), -float(r.get("_ts", 0.0)))
+
+
+def _select_final(results: List[dict], top_n: int, preferred: List[str]) -> List[dict]:
+    """
+    Pick top_n items interleaved across categories: every category's best item,
+    then every category's second best, and so on. Within a round preferred
+    categories come first, then higher confidence, then fresher items.
+    """
+    by_cat: dict = {}
+    for r in results:
+        by_cat.setdefault(r["category"], []).append(r)
+    ranked = []
+    for items in by_cat.values():
+        items.sort(key=_best_first)
+        ranked.extend(enumerate(items))
+    picked = heapq.nsmallest(
+        top_n,
+        ranked,
+        key=lambda p: (p[0], p[1]["category"] not in preferred) + _best_first(p[1]),
+    )
+    return [r for _, r in picked]
+
+
+def check_selection():
+    """Offline check: equal-confidence items from two categories both make the cut."""
+    results = [
+        {"category": c, "confidence": 0.7, "_ts": float(i), "title": f"{c}{i}"}
+        for c in ("world", "tech")
+        for i in range(10)
+    ]
+    for preferred in ([], ["tech", "business"], ["world"]):
+        cats = {r["category"] for r in _select_final(results, 5, preferred)}
+        assert cats == {"world", "tech"}, f"preferred={preferred}: only {cats}"
+    print("ok: two-category briefing contains both categories")
+
 
 def generate_briefing(
     user_id: str = "default",
     top_n: int = 10,
     categories: Optional[List[str]] = None,
 ):
-    mem = load_memory() or {}
+    # memory.json is read once here and written once (atomically) on exit
+    with edit_memory() as mem:
+        return _generate_briefing(mem, user_id, top_n, categories)
+
+
+def _generate_briefing(
+    mem: dict,
+    user_id: str,
+    top_n: int,
+    categories: Optional[List[str]],
+):
     preferred_categories = mem.get("user_prefs", {}).get("categories", [])
-    last_fps = mem.get("last_briefing", {}).get("items", [])
+    # set for O(1) membership; persisted as a list
+    last_fps = set(mem.get("last_briefing", {}).get("items", []))
 
     trace = new_trace()
     t0 = time.time()
@@ -44,7 +122,7 @@ def generate_briefing(
             for c in categories
             if c and isinstance(c, str)
         ]
-        cats = [c for c in cats if c in SUPPORTED_CATEGORIES]
+        cats = [c for c in cats if c in _SUPPORTED]
         if not cats:
             cats = None
     else:
@@ -52,30 +130,13 @@ def generate_briefing(
 
     # FETCH
     start_fetch = time.time()
-    collected = []
-
     if cats:
         # explicit categories: fetch up to top_n per category (before trimming)
-        for c in cats:
-            try:
-                arts = fetch_rss(c, num=max(top_n, 5))
-                # annotate category at source level
-                for a in arts:
-                    a.setdefault("category", c)
-                collected.extend(arts)
-            except Exception as e:
-                logger.warning("fetch_rss error for %s: %s", c, e)
+        collected = _fetch_categories(cats, num=max(top_n, 5))
     else:
         # if none provided, fetch across a subset of supported categories
         sample_cats = SUPPORTED_CATEGORIES[:5]
-        for c in sample_cats:
-            try:
-                arts = fetch_rss(c, num=max(3, top_n // 2))
-                for a in arts:
-                    a.setdefault("category", c)
-                collected.extend(arts)
-            except Exception as e:
-                logger.warning("fetch_rss error for %s: %s", c, e)
+        collected = _fetch_categories(sample_cats, num=max(3, top_n // 2))
 
     fetch_ms = int((time.time() - start_fetch) * 1000)
     add_step(trace, "fetch", fetch_ms, "ok", {"collected": len(collected)})
@@ -85,7 +146,7 @@ def generate_briefing(
     )
 
     # Dedupe by URL/title fingerprint
-    seen = set()
+    seen: set[int] = set()
     deduped = []
     for a in collected:
         fp = fingerprint_article(a)
@@ -103,10 +164,7 @@ def generate_briefing(
     if len(unique) < max(1, int(top_n * 0.6)):
         unique = deduped
 
-    # Shuffle for freshness
-    random.shuffle(unique)
-
-    # Summarize + categorize
+    # Categorize, then summarize all items in one batch
     results = []
     for a in unique:
         title = a.get("title", "") or ""
@@ -116,17 +174,6 @@ def generate_briefing(
         # prefer feed-level category; otherwise classify via heuristics
         category = a.get("category") or categorize_article(title, snippet)
 
-        s_start = time.time()
-        summ = call_gemini_summarize(title, snippet, url, max_sentences=2)
-        s_ms = int((time.time() - s_start) * 1000)
-        add_step(
-            trace,
-            "summarize_item",
-            s_ms,
-            "ok",
-            {"title": title[:80]},
-        )
-
         results.append(
             {
                 "title": title,
@@ -134,13 +181,30 @@ def generate_briefing(
                 "url": url,
                 "category": category,
                 "image": a.get("image", ""),
-                "summary": summ.get("summary"),
-                "tldr": summ.get("tldr"),
-                "confidence": float(summ.get("confidence", 0.5)),
                 "fingerprint": a.get("fingerprint"),
+                "_ts": a.get("_ts", 0.0),
             }
         )
 
+    s_start = time.time()
+    summaries = summarize_batch(
+        [(r["title"], r["snippet"], r["url"]) for r in results],
+        max_sentences=2,
+    )
+    s_ms = int((time.time() - s_start) * 1000)
+    add_step(
+        trace,
+        "summarize_batch",
+        s_ms,
+        "ok",
+        {"items": len(results)},
+    )
+
+    for r, summ in zip(results, summaries):
+        r["summary"] = summ.get("summary")
+        r["tldr"] = summ.get("tldr")
+        r["confidence"] = float(summ.get("confidence", 0.5))
+
     # If categories filter present, keep only those categories,
     # but don't throw everything away if misclassification happens.
     if cats:
@@ -149,17 +213,8 @@ def generate_briefing(
             results = filtered
         # else: keep unfiltered 'results' to avoid empty briefings
 
-    # Sort: preferred categories first, then by confidence (desc)
-    results = sorted(
-        results,
-        key=lambda r: (
-            r["category"] not in preferred_categories,
-            -float(r.get("confidence", 0.0)),
-        ),
-    )
-
-    # Trim final list to exactly top_n (if not enough, keep what we have)
-    final = results[:top_n]
+    # Select top_n round-robin across categories (if not enough, keep what we have)
+    final = _select_final(results, top_n, preferred_categories)
 
     briefing = {
         "generated_at": time.time(),
@@ -186,6 +241,9 @@ def generate_briefing(
         "items": [i["fingerprint"] for i in final if i.get("fingerprint")],
         "ts": time.time(),
     }
-    save_memory(mem)
 
     return briefing
+
+
+if __name__ == "__main__":
+    check_selection()
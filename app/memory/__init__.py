@@ -1,2 +1,2 @@
 # Import memory bank functions
-from .memory_bank import load_memory, save_memory
+from .memory_bank import load_memory, save_memory, edit_memory
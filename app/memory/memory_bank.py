@@ -1,38 +1,73 @@
-# app/memory/memory_bank.py
-import json, os, time
+import copy, os, tempfile, threading, time
+from contextlib import contextmanager
+
+from utils import dump_file, dumps, load_file
 
 DB_PATH = os.path.join(os.path.dirname(__file__), "memory.json")
+FEEDBACK_PATH = os.path.join(os.path.dirname(__file__), "feedback.jsonl")
 DEFAULT = {"user_prefs": {"categories": ["tech","business"], "max_items": 5}, "muted_sources": []}
 
+# In-process copy of memory.json, reused while the file's mtime is unchanged
+# (shared by all readers: treat it as read-only, edit through edit_memory)
+_CACHE = None
+_CACHE_MTIME = None
+# serializes cache refreshes and file writes across threads (re-entrant: save inside load)
+_LOCK = threading.RLock()
+
 def load_memory():
-    if not os.path.exists(DB_PATH):
-        save_memory(DEFAULT)
-    with open(DB_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    global _CACHE, _CACHE_MTIME
+    with _LOCK:
+        if not os.path.exists(DB_PATH):
+            save_memory(copy.deepcopy(DEFAULT))
+        mtime = os.stat(DB_PATH).st_mtime_ns
+        if _CACHE is None or mtime != _CACHE_MTIME:
+            with open(DB_PATH, "rb") as f:
+                _CACHE = load_file(f)
+            _CACHE_MTIME = mtime
+        return _CACHE
 
 def save_memory(obj):
-    with open(DB_PATH, "w", encoding="utf-8") as f:
-        json.dump(obj, f, indent=2)
+    global _CACHE, _CACHE_MTIME
+    with _LOCK:
+        # write to a unique temp file and swap it in, so a crash never leaves half a file
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(DB_PATH), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                dump_file(obj, f, indent=True)
+            os.replace(tmp, DB_PATH)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        _CACHE = obj
+        _CACHE_MTIME = os.stat(DB_PATH).st_mtime_ns
 
-def update_preferences(add_category=None, remove_category=None, set_categories=None):
-    mem = load_memory()
-    prefs = mem.get("user_prefs", {})
-    cats = prefs.get("categories", [])
-    if set_categories is not None:
-        cats = set_categories
-    if add_category:
-        if add_category not in cats:
-            cats.append(add_category)
-    if remove_category:
-        cats = [c for c in cats if c != remove_category]
-    prefs["categories"] = cats
-    mem["user_prefs"] = prefs
+@contextmanager
+def edit_memory():
+    """Yield a private copy of memory for edits and write it back once on exit.
+    Nothing is written if the block raises. Concurrent edits don't share state;
+    the last one to finish wins."""
+    mem = copy.deepcopy(load_memory())
+    yield mem
     save_memory(mem)
+
+def update_preferences(add_category=None, remove_category=None, set_categories=None):
+    with edit_memory() as mem:
+        prefs = mem.get("user_prefs", {})
+        cats = prefs.get("categories", [])
+        if set_categories is not None:
+            cats = set_categories
+        if add_category:
+            if add_category not in cats:
+                cats.append(add_category)
+        if remove_category:
+            cats = [c for c in cats if c != remove_category]
+        prefs["categories"] = cats
+        mem["user_prefs"] = prefs
     return prefs
 
 def add_feedback(fingerprint, score):
-    mem = load_memory()
-    fb = mem.get("feedback", [])
-    fb.append({"fp": fingerprint, "score": score, "ts": time.time()})
-    mem["feedback"] = fb
-    save_memory(mem)
+    # append-only: one JSON line per entry, no rewrite of memory.json
+    entry = {"fp": fingerprint, "score": score, "ts": time.time()}
+    with open(FEEDBACK_PATH, "a", encoding="utf-8") as f:
+        f.write(dumps(entry) + "\n")
@@ -4,15 +4,25 @@ Simple structured logger. Writes to stdout and an events log file (events.log).
 Logs are JSON-lines for easy ingestion.
 """
 
-import json
+import atexit
 import os
 import sys
-import datetime
+import threading
+import time
+
+from utils import dumps
 
 LOG_PATH = os.path.join(os.path.dirname(__file__), "events.log")
 
+# Opened once in line-buffered append mode; the lock keeps lines whole
+# when events are emitted from worker threads.
+_LOG_FH = open(LOG_PATH, "a", buffering=1, encoding="utf-8")
+_LOG_LOCK = threading.Lock()
+atexit.register(_LOG_FH.close)
+
 def _now_iso():
-    return datetime.datetime.utcnow().isoformat() + "Z"
+    now = time.time()
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now)) + f".{int(now % 1 * 1e6):06d}Z"
 
 def log_event(event_type: str, payload: dict):
     record = {
@@ -20,9 +30,9 @@ def log_event(event_type: str, payload: dict):
         "event": event_type,
         "payload": payload
     }
-    line = json.dumps(record, ensure_ascii=False)
+    line = dumps(record)
     # stdout
     print(line, file=sys.stdout)
     # append to file
-    with open(LOG_PATH, "a", encoding="utf-8") as f:
-        f.write(line + "\n")
+    with _LOG_LOCK:
+        _LOG_FH.write(line + "\n")
@@ -3,15 +3,37 @@
 Simple trace utility: create a trace object per briefing, append steps, and save as JSON in traces/ folder.
 """
 
-import json
+import atexit
 import os
+import queue
+import threading
 import uuid
 import time
 from typing import Dict, Any
 
+from utils import dump_file
+
 TRACE_DIR = os.path.join(os.path.dirname(__file__), "traces")
 os.makedirs(TRACE_DIR, exist_ok=True)
 
+# Traces are written by a background thread so callers don't wait on disk I/O.
+_TRACE_Q: "queue.Queue" = queue.Queue()
+
+def _trace_writer():
+    while True:
+        path, trace = _TRACE_Q.get()
+        try:
+            with open(path, "wb") as f:
+                dump_file(trace, f, indent=True)
+        except Exception as e:
+            print("⚠️ trace write failed:", path, e)
+        finally:
+            _TRACE_Q.task_done()
+
+threading.Thread(target=_trace_writer, name="trace-writer", daemon=True).start()
+# flush pending traces before the interpreter exits
+atexit.register(_TRACE_Q.join)
+
 def new_trace() -> Dict[str, Any]:
     return {"trace_id": str(uuid.uuid4()), "start_time": time.time(), "steps": [], "end_time": None}
 
@@ -26,8 +48,7 @@ def add_step(trace: Dict[str, Any], name: str, duration_ms: int, status: str = "
 def end_trace(trace: Dict[str, Any]):
     trace["end_time"] = time.time()
     path = os.path.join(TRACE_DIR, f"{trace['trace_id']}.json")
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(trace, f, indent=2)
+    _TRACE_Q.put((path, trace))
     return path
 
 def record_trace(name: str, func, *args, **kwargs):
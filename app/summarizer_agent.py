@@ -12,8 +12,10 @@ import os
 import re
 import json
 import math
+import threading
 from typing import List, Tuple, Dict, Optional
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 # SUMY extractive summarizers
 from sumy.parsers.plaintext import PlaintextParser
@@ -25,7 +27,6 @@ from sumy.summarizers.text_rank import TextRankSummarizer
 
 import nltk
 from nltk.corpus import stopwords
-from nltk.tokenize import sent_tokenize, word_tokenize
 
 # optional OpenAI generative rewrite (purely optional)
 try:
@@ -33,12 +34,41 @@ try:
 except Exception:
     OpenAI = None
 
-# Ensure required NLTK data (quiet)
+# optional Numba JIT for the fallback sentence-scoring kernel (purely optional)
+try:
+    import numpy as np
+    from numba import njit
+except Exception:
+    np = None
+    njit = None
+
+# Ensure required NLTK data (quiet); punkt is still needed by SUMY's Tokenizer
 nltk.download("punkt", quiet=True)
 nltk.download("stopwords", quiet=True)
 
 EN_STOPWORDS = set(stopwords.words("english"))
 
+# Regex fast path for sentence/word splitting (short RSS snippets don't need Punkt)
+_SENT_RE = re.compile(r"(?<=[.!?])\s+")
+_WORD_RE = re.compile(r"[A-Za-z]{3,}")
+
+# Below this many tokens the plain Python loop beats building the arrays
+_JIT_MIN_TOKENS = 2000
+
+if njit is not None:
+    @njit(cache=True)
+    def _score_kernel(ids, offsets, freq_arr):
+        """Per-sentence sum of token frequencies over a flat token-id array."""
+        out = np.zeros(len(offsets) - 1, dtype=np.float64)
+        for i in range(len(offsets) - 1):
+            s = 0.0
+            for j in range(offsets[i], offsets[i + 1]):
+                s += freq_arr[ids[j]]
+            out[i] = s
+        return out
+else:
+    _score_kernel = None
+
 # Optional OpenAI client
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY") or None
 openai_client = None
@@ -68,23 +98,38 @@ def _split_sentences(text: str) -> List[str]:
     text = text.strip()
     if not text:
         return []
-    return sent_tokenize(text)
+    return [s for s in _SENT_RE.split(text) if s]
 
 
 def _score_sentences_tfidf_like(text: str) -> Dict[str, float]:
     """Lightweight sentence scoring by counting keyword overlap.
     Returns dict sentence->score. Not a real TF-IDF but works well as a fallback."""
     sentences = _split_sentences(text)
-    tokens = [w.lower() for w in word_tokenize(text) if w.isalpha()]
-    tokens = [t for t in tokens if t not in EN_STOPWORDS and len(t) > 2]
-    freq = Counter(tokens)
+    # tokenize each sentence once; the whole-text frequencies are the sum over sentences
+    sent_tokens = [
+        [t for t in _WORD_RE.findall(s.lower()) if t not in EN_STOPWORDS]
+        for s in sentences
+    ]
+    n_tokens = sum(len(toks) for toks in sent_tokens)
+    if _score_kernel is not None and n_tokens >= _JIT_MIN_TOKENS:
+        # long inputs: encode to token ids + sentence offsets and score in native code
+        vocab: Dict[str, int] = {}
+        ids = np.fromiter(
+            (vocab.setdefault(t, len(vocab)) for toks in sent_tokens for t in toks),
+            dtype=np.int64,
+            count=n_tokens,
+        )
+        offsets = np.zeros(len(sent_tokens) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(toks) for toks in sent_tokens])
+        freq_arr = np.bincount(ids, minlength=len(vocab)).astype(np.float64)
+        out = _score_kernel(ids, offsets, freq_arr)
+        return {s: float(v) for s, v in zip(sentences, out)}
+
+    freq = Counter(t for toks in sent_tokens for t in toks)
     scores = {}
-    for s in sentences:
-        s_tokens = [w.lower() for w in word_tokenize(s) if w.isalpha()]
-        s_tokens = [t for t in s_tokens if t not in EN_STOPWORDS and len(t) > 2]
+    for s, s_tokens in zip(sentences, sent_tokens):
         # score = sum of freqs normalized
-        score = sum(freq.get(t, 0) for t in s_tokens)
-        scores[s] = float(score)
+        scores[s] = float(sum(freq[t] for t in s_tokens))
     return scores
 
 
@@ -93,12 +138,25 @@ def extract_keywords_simple(text: str, top_k: int = 8) -> List[Tuple[str, int]]:
     if not text:
         return []
     text = text.lower()
-    tokens = [w for w in re.findall(r"[a-zA-Z]{3,}", text)]
+    tokens = _WORD_RE.findall(text)
     tokens = [t for t in tokens if t not in EN_STOPWORDS]
     counts = Counter(tokens)
     return counts.most_common(top_k)
 
 
+# Compiled once, applied in order by compress_sentence_heuristic
+_COMPRESS_PATTERNS = [
+    # remove parentheses/brackets content
+    (re.compile(r"\([^)]*\)"), " "),
+    (re.compile(r"\[[^\]]*\]"), " "),
+    # remove relative clauses (naive)
+    (re.compile(r"\b(?:that|which|who|where|when)\b.*", re.IGNORECASE), ""),
+    # remove multiple commas/ spaces
+    (re.compile(r",\s*,+"), ","),
+    (re.compile(r"\s+"), " "),
+]
+
+
 def compress_sentence_heuristic(sentence: str) -> str:
     """Heuristic, rule-based sentence compression:
     - remove parenthetical or bracketed content
@@ -109,17 +167,9 @@ def compress_sentence_heuristic(sentence: str) -> str:
         return sentence
 
     s = sentence.strip()
-
-    # remove parentheses/brackets content
-    s = re.sub(r"\([^)]*\)", " ", s)
-    s = re.sub(r"\[[^\\]]*\\]", " ", s)
-
-    # remove relative clauses (naive)
-    s = re.sub(r"\b(that|which|who|where|when)\b.*", "", s, flags=re.IGNORECASE)
-
-    # remove multiple commas/ spaces
-    s = re.sub(r",\s*,+", ",", s)
-    s = re.sub(r"\s+", " ", s).strip()
+    for pat, repl in _COMPRESS_PATTERNS:
+        s = pat.sub(repl, s)
+    s = s.strip()
 
     # Ensure sentence ends with period
     if not s.endswith("."):
@@ -137,18 +187,25 @@ _SUMMARY_METHODS = {
     "textrank": TextRankSummarizer,
 }
 
+# Built once and reused: Tokenizer("english") loads Punkt data on construction.
+# Summarizer instances are shared across threads, so calls go through a per-method lock.
+_TOKENIZER = Tokenizer("english")
+_SUMMARIZERS = {k: cls() for k, cls in _SUMMARY_METHODS.items()}
+_SUMMARIZER_LOCKS = {k: threading.Lock() for k in _SUMMARY_METHODS}
+
 
 def summarize_with_sumy(text: str, method: str = "lexrank", sentence_count: int = 3) -> str:
     """Run SUMY summarizer and return joined sentences."""
     if not text:
         return ""
 
-    parser = PlaintextParser.from_string(text, Tokenizer("english"))
+    parser = PlaintextParser.from_string(text, _TOKENIZER)
     method = method.lower()
-    SummClass = _SUMMARY_METHODS.get(method, LexRankSummarizer)
-    summarizer = SummClass()
+    key = method if method in _SUMMARIZERS else "lexrank"
+    summarizer = _SUMMARIZERS[key]
     try:
-        summary_sentences = summarizer(parser.document, sentence_count)
+        with _SUMMARIZER_LOCKS[key]:
+            summary_sentences = summarizer(parser.document, sentence_count)
         summary = " ".join(str(s) for s in summary_sentences).strip()
         if summary:
             return summary
@@ -214,6 +271,7 @@ def _openai_rewrite(extractive: str, direction: str = "concise") -> Optional[str
 def hybrid_summarize(title: str, snippet: str, url: str, method: str = "lexrank", max_sentences: int = 3, use_openai_if_available: bool = True) -> Dict:
     """
     Hybrid pipeline:
+    0. Return short inputs (<= max_sentences sentences) as-is
     1. Run extractive summarizer (SUMY) with chosen method
     2. Extract keywords from (title + snippet)
     3. Compress sentences heuristically
@@ -224,6 +282,18 @@ def hybrid_summarize(title: str, snippet: str, url: str, method: str = "lexrank"
     snippet = _clean_text(snippet or "")
     combined = (title + "\n\n" + snippet).strip() or title or snippet
 
+    # 0) short input (typical RSS snippet): already as short as the summary would be
+    sents = _split_sentences(combined)
+    if len(sents) <= max_sentences:
+        return {
+            "summary": _clean_text(combined),
+            "tldr": _clean_text(sents[0]) if sents else combined,
+            "confidence": 0.7,
+            "keywords": [k for k, _ in extract_keywords_simple(combined, top_k=8)],
+            "method": "identity",
+            "gen_used": False,
+        }
+
     # 1) Extractive output
     extractive_raw = summarize_with_sumy(combined, method=method, sentence_count=max_sentences)
     if not extractive_raw:
@@ -308,3 +378,24 @@ def call_gemini_summarize(title: str, snippet: str, url: str, max_sentences: int
             "tldr": base_text.split(".")[0] + "...",
             "confidence": 0.4
         }
+
+
+# max concurrent items when the OpenAI rewrite (network-bound) is active
+SUMMARIZE_WORKERS = 8
+
+
+def summarize_batch(items: List[Tuple[str, str, str]], max_sentences: int = 3) -> List[Dict]:
+    """
+    Summarize a list of (title, snippet, url) items in one call.
+    Returns one result dict per item, in input order (same shape as call_gemini_summarize).
+    With an OpenAI client configured, items run on a thread pool so the rewrite
+    round-trips overlap; the extractive-only path is CPU-bound and stays sequential.
+    """
+    def _one(item):
+        title, snippet, url = item
+        return call_gemini_summarize(title, snippet, url, max_sentences=max_sentences)
+
+    if openai_client and len(items) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(items), SUMMARIZE_WORKERS)) as executor:
+            return list(executor.map(_one, items))
+    return [_one(item) for item in items]
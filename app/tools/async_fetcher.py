@@ -0,0 +1,70 @@
+# app/tools/async_fetcher.py
+"""
+Concurrent raw HTTP downloads with aiohttp.
+- fetch_all(urls) downloads every URL on one event loop and returns
+  (status, body_bytes, headers) per URL, or None for a failed URL.
+- Per-URL extra request headers (e.g. conditional GET validators) are supported.
+- Parsing is left to the caller (e.g. feedparser.parse(body)).
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.WARNING)
+
+# max open connections per fetch_all() call
+MAX_CONNECTIONS = 64
+
+Response = Tuple[int, bytes, Dict[str, str]]
+
+
+async def _get(session: aiohttp.ClientSession, url: str, headers: Optional[Dict[str, str]] = None) -> Optional[Response]:
+    try:
+        async with session.get(url, headers=headers) as r:
+            r.raise_for_status()
+            body = await r.read()
+            # lower-case names so callers can look headers up directly
+            return r.status, body, {k.lower(): v for k, v in r.headers.items()}
+    except Exception as e:
+        logger.warning("Failed HTTP %s : %s", url, e)
+        return None
+
+
+async def _gather(
+    urls: List[str],
+    timeout: float,
+    headers: Optional[Dict[str, str]],
+    per_url_headers: List[Optional[Dict[str, str]]],
+) -> List[Optional[Response]]:
+    connector = aiohttp.TCPConnector(limit=MAX_CONNECTIONS)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    async with aiohttp.ClientSession(connector=connector, timeout=client_timeout, headers=headers) as session:
+        return await asyncio.gather(*(_get(session, u, h) for u, h in zip(urls, per_url_headers)))
+
+
+def fetch_all(
+    urls: List[str],
+    timeout: float = 10,
+    headers: Optional[Dict[str, str]] = None,
+    per_url_headers: Optional[List[Optional[Dict[str, str]]]] = None,
+) -> List[Optional[Response]]:
+    """
+    Download all `urls` concurrently; results are in input order.
+    `headers` go on every request, `per_url_headers[i]` only on urls[i].
+    Must be called from a thread without a running event loop (raises RuntimeError otherwise).
+    """
+    if not urls:
+        return []
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        raise RuntimeError("fetch_all() cannot run inside a running event loop")
+    urls = list(urls)
+    per_url_headers = per_url_headers or [None] * len(urls)
+    return asyncio.run(_gather(urls, timeout, headers, per_url_headers))
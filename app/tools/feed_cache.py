@@ -0,0 +1,86 @@
+# app/tools/feed_cache.py
+"""
+Persistent per-feed cache for HTTP conditional GET.
+- Remembers each feed's ETag / Last-Modified and its parsed articles.
+- On a 304 Not Modified the cached articles are reused instead of re-parsing.
+Stored as JSON in tools/cache/feed_cache.json:
+    {url: {"ts", "etag", "modified", "entries": [article, ...]}}
+"""
+
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+from utils import dump_file, load_file
+
+CACHE_PATH = os.path.join(os.path.dirname(__file__), "cache", "feed_cache.json")
+
+
+class FeedCache:
+    def __init__(self, path: str = CACHE_PATH):
+        self.path = path
+        self._data: Optional[Dict[str, Dict]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Dict]:
+        # caller holds the lock
+        if self._data is None:
+            try:
+                with open(self.path, "rb") as f:
+                    self._data = load_file(f)
+            except Exception:
+                self._data = {}
+        return self._data
+
+    def validators(self, url: str) -> Dict[str, str]:
+        """Conditional request headers for `url` (empty if nothing is cached)."""
+        with self._lock:
+            entry = self._load().get(url) or {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("modified"):
+            headers["If-Modified-Since"] = entry["modified"]
+        return headers
+
+    def articles(self, url: str) -> Optional[List[Dict]]:
+        """Cached articles for `url` (fresh dict copies), or None."""
+        with self._lock:
+            entry = self._load().get(url)
+        if entry is None:
+            return None
+        return [dict(a) for a in entry.get("entries", [])]
+
+    def put(self, url: str, articles: List[Dict], etag: Optional[str], modified: Optional[str]):
+        with self._lock:
+            self._load()[url] = {
+                "ts": time.time(),
+                "etag": etag,
+                "modified": modified,
+                "entries": [dict(a) for a in articles],
+            }
+            self._dirty = True
+
+    def save(self):
+        """Write the cache to disk (atomically) if anything changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            # unique temp file: other processes (gunicorn workers, Streamlit) save here too
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(self.path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    dump_file(self._data, f)
+                os.replace(tmp, self.path)
+            except BaseException:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+                raise
+            self._dirty = False
+
+
+FEED_CACHE = FeedCache()
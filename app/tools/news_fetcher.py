@@ -1,5 +1,9 @@
 import feedparser
 from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+
+from utils import key_hash
+from .rss_fetcher import get_session, FETCH_TIMEOUT
 
 # You can add/remove feeds here
 RSS_FEEDS = [
@@ -10,39 +14,55 @@ RSS_FEEDS = [
 ]
 
 
+def _parse_headlines(feed_url: str) -> List[Dict]:
+    """Parse one feed into article dicts; a failing feed yields no articles."""
+    try:
+        # download on the shared keep-alive session, then parse the bytes
+        resp = get_session().get(feed_url, timeout=FETCH_TIMEOUT)
+        resp.raise_for_status()
+        headers = {k.lower(): v for k, v in resp.headers.items()}
+        parsed = feedparser.parse(resp.content, response_headers=headers)
+    except Exception:
+        return []
+
+    if "entries" not in parsed:
+        return []
+
+    articles = []
+    for entry in parsed.entries:
+        title = entry.get("title", "")
+        description = entry.get("summary", "") or entry.get("description", "")
+        link = entry.get("link", "")
+
+        if title and link:
+            articles.append({
+                "title": title,
+                "snippet": description[:250],  # limit size
+                "url": link
+            })
+    return articles
+
+
 def fetch_top_headlines(num: int = 5) -> List[Dict]:
     """
     Fetches real news headlines from RSS feeds.
     Returns a list of dicts: [{"title":..., "snippet":..., "url":...}, ...]
     """
-    articles = []
-
-    for feed_url in RSS_FEEDS:
-        parsed = feedparser.parse(feed_url)
-
-        if "entries" not in parsed:
-            continue
-
-        for entry in parsed.entries:
-            title = entry.get("title", "")
-            description = entry.get("summary", "") or entry.get("description", "")
-            link = entry.get("link", "")
+    # fetch all feeds concurrently; map() keeps feed order
+    with ThreadPoolExecutor(max_workers=min(len(RSS_FEEDS), 8)) as executor:
+        per_feed = list(executor.map(_parse_headlines, RSS_FEEDS))
 
-            if title and link:
-                articles.append({
-                    "title": title,
-                    "snippet": description[:250],  # limit size
-                    "url": link
-                })
+    articles = [a for feed_articles in per_feed for a in feed_articles]
 
     # Deduplicate and trim
-    unique_titles = set()
+    unique_titles: set[int] = set()
     cleaned_articles = []
 
     for a in articles:
-        if a["title"] not in unique_titles:
+        h = key_hash(a["title"])
+        if h not in unique_titles:
             cleaned_articles.append(a)
-            unique_titles.add(a["title"])
+            unique_titles.add(h)
 
     # Return first N
     return cleaned_articles[:num]
@@ -2,22 +2,77 @@
 """
 Robust RSS fetcher.
 - Uses feedparser to parse RSS/Atom.
-- Returns list of dicts: {"title","snippet","url","published","image"}
-- Supports multiple feeds per category.
+- Returns list of dicts: {"title","snippet","url","published","image","_ts"}
+  (`_ts` = published time as epoch seconds, used for freshest-first selection)
+- Supports multiple feeds per category (fetched concurrently, parsed
+  across processes when many feeds come back at once).
+- Revalidates feeds with conditional GET (see feed_cache.py).
+- Caches fetch_rss results in-process for a short TTL.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
+from collections import OrderedDict
 import feedparser
-import requests  # kept in case you later add direct HTTP checks
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 from html import unescape
 import re
+import threading
 import time
-import random
+import heapq
+import calendar
+from io import BytesIO
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import os
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from .feed_cache import FEED_CACHE
+
+# optional C-backed HTML parser for snippet text (falls back to regex stripping)
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except Exception:
+    HTMLParser = None
+
+# optional numpy for column-wise dedupe/selection on large article sets
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+# below this many candidates the plain set/heap path is faster than building arrays
+_SOA_MIN_ARTICLES = 200
+
+# optional lxml streaming parser for feed bytes (falls back to feedparser)
+try:
+    from lxml import etree
+except Exception:
+    etree = None
+
+_MEDIA_NS = "http://search.yahoo.com/mrss/"
+_ATOM_NS = "http://www.w3.org/2005/Atom"
+_CONTENT_NS = "http://purl.org/rss/1.0/modules/content/"
+
+# optional aiohttp downloader (falls back to threaded requests)
+try:
+    from .async_fetcher import fetch_all
+except Exception:
+    fetch_all = None
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.WARNING)
 
+# process pool for CPU-bound feed parsing; used once a batch has this many bodies.
+# Capped small: each feed parses in milliseconds, so more processes only cost memory.
+PARSE_WORKERS = min(4, os.cpu_count() or 1)
+PARSE_PROCESS_MIN_FEEDS = 4
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+_PARSE_POOL_LOCK = threading.Lock()
+
 # Main category -> list of feed URLs.
 RSS_FEEDS = {
     "tech": [
@@ -69,6 +124,60 @@ RSS_FEEDS = {
 SUPPORTED_CATEGORIES = sorted(list(RSS_FEEDS.keys()))
 
 
+def _build_feeds_index() -> Dict[str, Tuple[str, ...]]:
+    """category/alias -> feed URLs, covering singular/plural spellings.
+    Exact keys are added last so they win over another key's alias."""
+    index: Dict[str, Tuple[str, ...]] = {}
+    normalized = {
+        k: (v,) if isinstance(v, str) else tuple(v)
+        for k, v in RSS_FEEDS.items()
+    }
+    for k, urls in normalized.items():
+        for alias in (k.rstrip("s"), k + "s"):
+            index.setdefault(alias, urls)
+    index.update(normalized)
+    return index
+
+
+_FEEDS_INDEX = _build_feeds_index()
+
+FETCH_TIMEOUT = 10  # seconds per feed request
+
+# Compiled once; used for every entry of every feed
+_RE_TAG = re.compile(r"<[^>]+>")
+# <script>/<style> blocks: their contents are code, not snippet text
+_RE_SCRIPT = re.compile(r"<(script|style)\b[^>]*>.*?(?:</\1\s*>|\Z)", re.I | re.S)
+_RE_WS = re.compile(r"\s+")
+_RE_IMG = re.compile(r'<img[^>]+src=["\']([^"\']+)["\']')
+
+
+# In-process TTL cache for fetch_rss: collapses repeat requests from UI reruns
+RSS_CACHE_TTL = 120  # seconds
+_RSS_CACHE_MAX = 128
+_RSS_CACHE: "OrderedDict[Tuple[str, int], Tuple[float, List[Dict]]]" = OrderedDict()
+_RSS_CACHE_LOCK = threading.Lock()
+
+
+def _new_session() -> requests.Session:
+    session = requests.Session()
+    # pool sized for concurrent category fetches; keep-alive reuses TCP/TLS per host
+    # small retry budget for transient upstream errors
+    retries = Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504), allowed_methods=("GET",))
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = feedparser.USER_AGENT
+    return session
+
+
+_SESSION = _new_session()
+
+
+def get_session() -> requests.Session:
+    """Shared pooled HTTP session used for feed downloads."""
+    return _SESSION
+
+
 def _extract_image_from_entry(entry) -> str:
     # Try common RSS media fields
 
@@ -101,10 +210,18 @@ def _extract_image_from_entry(entry) -> str:
             return L.get("href")
 
     # 4) Try to parse an <img> from summary
+    # (substring gate first: most summaries carry no image, and `in` is far
+    # cheaper than a regex scan that ends in a miss)
     summary = entry.get("summary") or entry.get("description") or ""
-    m = re.search(r'<img[^>]+src=["\']([^"\']+)["\']', summary)
-    if m:
-        return m.group(1)
+    if "<img" in summary:
+        m = _RE_IMG.search(summary)
+        if m:
+            return m.group(1)
+        if HTMLParser is not None:
+            # unquoted / unusual src attributes the regex fast path misses
+            node = HTMLParser(summary).css_first("img")
+            if node is not None and node.attributes.get("src"):
+                return node.attributes["src"]
 
     # 5) Try 'thumbnail' field
     if entry.get("thumbnail"):
@@ -116,19 +233,179 @@ def _extract_image_from_entry(entry) -> str:
 def _clean_text(html_text: str) -> str:
     if not html_text:
         return ""
-    text = re.sub(r"<[^>]+>", "", html_text)
-    text = unescape(text)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+    if HTMLParser is not None:
+        # real HTML parse: drops tags (script/style with their contents), decodes entities
+        tree = HTMLParser(html_text)
+        tree.strip_tags(["script", "style"])
+        return _RE_WS.sub(" ", tree.text(separator=" ")).strip()
+    html_text = _RE_SCRIPT.sub(" ", html_text)
+    return _RE_WS.sub(" ", unescape(_RE_TAG.sub("", html_text))).strip()
 
 
-def _parse_feed(url: str, num: int = 5) -> List[Dict]:
+def _parse_feed(url: str, num: int = 5, session: Optional[requests.Session] = None) -> List[Dict]:
     """
-    Parse a single feed URL and return up to ~num*3 articles.
+    Download and parse a single feed URL and return up to ~num*3 articles.
     Actual trimming to final `num` is done in fetch_rss().
     """
     try:
-        f = feedparser.parse(url)
+        resp = (session or _SESSION).get(
+            url, timeout=FETCH_TIMEOUT, headers=FEED_CACHE.validators(url)
+        )
+        resp.raise_for_status()
+    except Exception as e:
+        logger.warning("Failed parse %s : %s", url, e)
+        return []
+    # feedparser expects lower-cased header names for encoding detection
+    headers = {k.lower(): v for k, v in resp.headers.items()}
+    return _handle_response(url, resp.status_code, resp.content, headers, num=num)
+
+
+def _handle_response(url: str, status: int, body: bytes, headers: Dict[str, str], num: int = 5) -> List[Dict]:
+    """
+    Turn a feed HTTP response into articles, honouring conditional GET:
+    304 reuses the cached articles; a fresh 200 with validators is cached.
+    """
+    if status == 304:
+        cached = FEED_CACHE.articles(url)
+        if cached is not None:
+            return cached
+        return []
+
+    return _remember(url, _parse_feed_body(url, body, headers, num=num), headers)
+
+
+def _remember(url: str, articles: List[Dict], headers: Dict[str, str]) -> List[Dict]:
+    """Cache a fresh response's articles under its ETag / Last-Modified validators."""
+    etag = headers.get("etag")
+    modified = headers.get("last-modified")
+    if articles and (etag or modified):
+        FEED_CACHE.put(url, articles, etag, modified)
+    return articles
+
+
+def _parse_date(value: str) -> float:
+    """RFC 822 (RSS) or ISO 8601 (Atom) date -> epoch seconds; 0 if unparseable."""
+    value = (value or "").strip()
+    if not value:
+        return 0.0
+    try:
+        dt = parsedate_to_datetime(value)
+    except Exception:
+        try:
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except Exception:
+            return 0.0
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def _lxml_image(elem, summary: str) -> str:
+    """Same lookup order as _extract_image_from_entry, on a raw <item>/<entry>."""
+    for tag in ("content", "thumbnail"):
+        for node in elem.iterfind("{%s}%s" % (_MEDIA_NS, tag)):
+            if node.get("url"):
+                return node.get("url")
+    for node in elem.iterfind("{*}enclosure"):
+        if (node.get("type") or "").startswith("image") and node.get("url"):
+            return node.get("url")
+    for node in elem.iterfind("{*}link"):
+        if node.get("rel") == "enclosure" and (node.get("type") or "").startswith("image"):
+            return node.get("href") or ""
+    if "<img" not in summary:
+        return ""
+    m = _RE_IMG.search(summary)
+    return m.group(1) if m else ""
+
+
+def _lxml_summary(elem) -> str:
+    """Summary markup like feedparser's: description/summary, else the full
+    content (Atom <content>, RSS <content:encoded>)."""
+    text = elem.findtext("{*}description") or elem.findtext("{*}summary")
+    if text:
+        return text
+    for tag in ("{%s}content" % _ATOM_NS, "{%s}encoded" % _CONTENT_NS):
+        node = elem.find(tag)
+        if node is not None:
+            # Atom type="xhtml" carries the markup as child elements
+            return (node.text or "") + "".join(etree.tostring(c, encoding="unicode") for c in node)
+    return ""
+
+
+def _parse_feed_lxml(body: bytes, num: int = 5) -> Optional[List[Dict]]:
+    """
+    Fast path: stream <item>/<entry> elements with lxml.iterparse and read the
+    few fields we need directly. Returns None (caller falls back to feedparser)
+    if lxml is missing, the XML is malformed, or no items were found.
+    """
+    if etree is None or not body:
+        return None
+
+    articles: List[Dict] = []
+    max_entries = max(num * 3, 30)  # look deeper for richer feeds
+    seen_entries = 0
+    try:
+        for _, elem in etree.iterparse(
+            BytesIO(body),
+            events=("end",),
+            tag=("{*}item", "{*}entry"),
+            resolve_entities=False,
+            no_network=True,
+        ):
+            seen_entries += 1
+            title = (elem.findtext("{*}title") or "").strip()
+            summary = _lxml_summary(elem)
+            link = ""
+            for node in elem.iterfind("{*}link"):
+                if node.text and node.text.strip():
+                    link = node.text.strip()  # RSS <link>url</link>
+                    break
+                if node.get("href") and node.get("rel", "alternate") == "alternate":
+                    link = node.get("href")  # Atom <link href="url"/>
+                    break
+            link = link or (elem.findtext("{*}guid") or elem.findtext("{*}id") or "").strip()
+            published = (
+                elem.findtext("{*}pubDate")
+                or elem.findtext("{*}published")
+                or elem.findtext("{*}updated")
+                or elem.findtext("{*}date")
+                or ""
+            ).strip()
+            image = _lxml_image(elem, summary)
+
+            # release the element (and already-processed siblings) as we go
+            elem.clear(keep_tail=False)
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+            if title or link:
+                articles.append(
+                    {
+                        "title": title,
+                        "snippet": _clean_text(summary),
+                        "url": link,
+                        "published": published,
+                        "image": image,
+                        "_ts": _parse_date(published),
+                    }
+                )
+            if seen_entries >= max_entries:
+                break
+    except Exception:
+        return None
+
+    return articles or None
+
+
+def _parse_feed_body(url: str, body: bytes, headers: Optional[Dict[str, str]] = None, num: int = 5) -> List[Dict]:
+    """Parse already-downloaded feed bytes into up to ~num*3 articles."""
+    fast = _parse_feed_lxml(body, num=num)
+    if fast is not None:
+        return fast
+
+    # fallback: feedparser copes with malformed / unusual feeds
+    try:
+        f = feedparser.parse(body, response_headers=headers or {})
         entries = f.entries or []
     except Exception as e:
         logger.warning("Failed parse %s : %s", url, e)
@@ -142,6 +419,9 @@ def _parse_feed(url: str, num: int = 5) -> List[Dict]:
         snippet = _clean_text(e.get("summary", "") or e.get("description", ""))
         link = e.get("link") or e.get("id") or ""
         published = e.get("published") or e.get("updated") or ""
+        # epoch seconds (UTC) for freshness ranking; 0 when the feed gives no date
+        parsed_ts = e.get("published_parsed") or e.get("updated_parsed")
+        ts = float(calendar.timegm(parsed_ts)) if parsed_ts else 0.0
         image = _extract_image_from_entry(e) or ""
 
         if not (title or link):
@@ -154,58 +434,237 @@ def _parse_feed(url: str, num: int = 5) -> List[Dict]:
                 "url": link,
                 "published": published,
                 "image": image,
+                "_ts": ts,
             }
         )
 
     return articles
 
 
-def fetch_rss(category: str, num: int = 5) -> List[Dict]:
+def fetch_rss(category: str, num: int = 5, session: Optional[requests.Session] = None) -> List[Dict]:
     """
     Fetch up to `num` articles for `category` (category key).
     If multiple feeds exist for the category, aggregate and dedupe by URL+title
-    and return up to num.
+    and return up to num. Feeds are downloaded with aiohttp when available;
+    otherwise on threads via `session` (defaults to the shared pooled session).
+    Results are cached in-process for RSS_CACHE_TTL seconds per (category, num).
     """
-    cat = (category or "tech").lower()
-    # tolerant lookup
-    feeds = (
-        RSS_FEEDS.get(cat)
-        or RSS_FEEDS.get(cat.rstrip("s"))
-        or RSS_FEEDS.get(cat + "s")
+    return fetch_rss_many([category], num=num, session=session).get(
+        (category or "tech").lower(), []
     )
-    if not feeds:
-        # ultimate fallback: tech feeds
-        feeds = RSS_FEEDS.get("tech", [])
 
-    if isinstance(feeds, str):
-        feed_urls = [feeds]
-    else:
-        feed_urls = list(feeds)
 
-    all_articles: List[Dict] = []
-    seen = set()
+def fetch_rss_many(
+    categories: List[str],
+    num: int = 5,
+    session: Optional[requests.Session] = None,
+) -> Dict[str, List[Dict]]:
+    """
+    Fetch up to `num` articles for each category in one fan-out.
+    All feed URLs of all (uncached) categories are downloaded together, so
+    latency tracks the slowest feed rather than categories x feeds, and a feed
+    shared by several categories is fetched once.
+    Returns {lower-cased category: articles}.
+    """
+    cats = list(dict.fromkeys((c or "tech").lower() for c in categories))
+    now = time.time()
+    out: Dict[str, List[Dict]] = {}
+    misses: List[str] = []
+    with _RSS_CACHE_LOCK:
+        for cat in cats:
+            hit = _RSS_CACHE.get((cat, num))
+            if hit and now - hit[0] < RSS_CACHE_TTL:
+                # copies: callers annotate the returned dicts
+                out[cat] = [dict(a) for a in hit[1]]
+            else:
+                misses.append(cat)
+    if not misses:
+        return out
+
+    # tolerant lookup (singular/plural aliases); ultimate fallback: tech feeds
+    cat_urls = {
+        cat: _FEEDS_INDEX.get(cat) or _FEEDS_INDEX.get("tech", ())
+        for cat in misses
+    }
+    all_urls = list(dict.fromkeys(u for urls in cat_urls.values() for u in urls))
+    parsed_by_url = dict(zip(all_urls, _download_feeds(all_urls, num=num, session=session)))
+
+    # persist any new ETag / Last-Modified validators
+    try:
+        FEED_CACHE.save()
+    except Exception as e:
+        logger.warning("Failed to save feed cache: %s", e)
+
+    for cat, urls in cat_urls.items():
+        articles = _select_articles([parsed_by_url[u] for u in urls], num)
+        out[cat] = articles
+        if articles:
+            # don't pin an empty result (e.g. all feeds down) for the whole TTL
+            with _RSS_CACHE_LOCK:
+                _RSS_CACHE[(cat, num)] = (now, [dict(a) for a in articles])
+                _RSS_CACHE.move_to_end((cat, num))
+                while len(_RSS_CACHE) > _RSS_CACHE_MAX:
+                    _RSS_CACHE.popitem(last=False)
+    return out
+
+
+def _download_feeds(
+    feed_urls: List[str],
+    num: int = 5,
+    session: Optional[requests.Session] = None,
+) -> List[List[Dict]]:
+    """Download and parse every feed concurrently; one article list per URL, in order."""
+    if not feed_urls:
+        return []
+
+    if fetch_all is not None:
+        # download every feed on one aiohttp event loop, then parse the bytes
+        try:
+            responses = fetch_all(
+                feed_urls,
+                timeout=FETCH_TIMEOUT,
+                headers={"User-Agent": feedparser.USER_AGENT},
+                per_url_headers=[FEED_CACHE.validators(u) for u in feed_urls],
+            )
+            # 304s come from the feed cache; fresh bodies are parsed in one batch
+            fresh = [(u, r) for u, r in zip(feed_urls, responses) if r and r[0] != 304]
+            parsed = dict(zip((u for u, _ in fresh), _parse_bodies(fresh, num)))
+            out: List[List[Dict]] = []
+            for url, resp in zip(feed_urls, responses):
+                if not resp:
+                    out.append([])
+                elif url in parsed:
+                    out.append(_remember(url, parsed[url], resp[2]))
+                else:
+                    out.append(_handle_response(url, *resp, num=num))
+            return out
+        except RuntimeError:
+            # called from inside a running event loop; use the threaded path
+            pass
 
-    for url in feed_urls:
+    def _fetch_one(url: str) -> List[Dict]:
+        # per-feed guard so one bad feed can't poison the batch
         try:
-            parsed = _parse_feed(url, num=num)
-            for a in parsed:
-                url_clean = (a.get("url") or "").split("?")[0]
-                title = a.get("title") or ""
-                key = (url_clean + "|" + title).lower().strip()
-                if not key:
-                    continue
-                if key in seen:
-                    continue
-                seen.add(key)
-                all_articles.append(a)
+            return _parse_feed(url, num=num, session=session)
         except Exception as e:
             logger.warning("Failed HTTP/parse %s : %s", url, e)
+            return []
+
+    # download/parse all feeds concurrently on threads (network-bound);
+    # 16 matches the shared session's connection pool
+    with ThreadPoolExecutor(max_workers=min(len(feed_urls), 16)) as executor:
+        return list(executor.map(_fetch_one, feed_urls))
+
+
+def _parse_pool() -> Optional[ProcessPoolExecutor]:
+    """Process-wide pool for parsing feed bytes (created on first use)."""
+    global _PARSE_POOL
+    if PARSE_WORKERS < 2:
+        return None
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is None:
+            # never fork: the host process (Streamlit, gunicorn gthread, the trace
+            # writer) is always multi-threaded; forkserver/spawn start clean workers
+            methods = multiprocessing.get_all_start_methods()
+            ctx = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            _PARSE_POOL = ProcessPoolExecutor(max_workers=PARSE_WORKERS, mp_context=ctx)
+        return _PARSE_POOL
+
+
+def _parse_bodies(responses: List[Tuple[str, Tuple[int, bytes, Dict[str, str]]]], num: int) -> List[List[Dict]]:
+    """
+    Parse downloaded (url, (status, body, headers)) pairs, in order.
+    Parsing is CPU-bound, so batches of PARSE_PROCESS_MIN_FEEDS or more are
+    spread over a process pool; smaller ones (or a broken pool) parse inline.
+    """
+    global _PARSE_POOL
+    urls = [u for u, _ in responses]
+    bodies = [r[1] for _, r in responses]
+    headers = [r[2] for _, r in responses]
+    pool = _parse_pool() if len(responses) >= PARSE_PROCESS_MIN_FEEDS else None
+    if pool is not None:
+        try:
+            return list(pool.map(_parse_feed_body, urls, bodies, headers, [num] * len(urls), chunksize=2))
+        except Exception as e:
+            logger.warning("Parse pool failed, parsing inline: %s", e)
+            with _PARSE_POOL_LOCK:
+                if _PARSE_POOL is pool:
+                    _PARSE_POOL = None
+            # reap the broken pool's processes; the next batch starts a fresh one
+            pool.shutdown(wait=False, cancel_futures=True)
+    return [_parse_feed_body(u, b, h, num=num) for u, b, h in zip(urls, bodies, headers)]
+
+
+def _select_articles(parsed_feeds: List[List[Dict]], num: int) -> List[Dict]:
+    """Dedupe one category's feeds by URL+title and keep the num freshest."""
+    # flatten to parallel columns (SoA): article refs, dedupe keys
+    refs: List[Dict] = []
+    keys: List[Tuple[str, str]] = []
+    for parsed in parsed_feeds:
+        for a in parsed:
+            url_clean = (a.get("url") or "").split("?")[0].casefold()
+            title = (a.get("title") or "").casefold()
+            if not url_clean and not title:
+                continue
+            refs.append(a)
+            keys.append((url_clean, title))
+
+    if np is not None and len(refs) >= _SOA_MIN_ARTICLES:
+        # dedupe (first occurrence wins) and top-N by freshness in numpy
+        ts = np.fromiter((a.get("_ts", 0.0) for a in refs), dtype=np.float64, count=len(refs))
+        hashes = np.fromiter((hash(k) for k in keys), dtype=np.int64, count=len(keys))
+        _, first = np.unique(hashes, return_index=True)
+        first.sort()
+        order = first[np.argsort(-ts[first], kind="stable")][:num]
+        # copy: a feed shared by several categories yields the same dicts
+        return [dict(refs[i]) for i in order]
+
+    all_articles: List[Dict] = []
+    seen: set[Tuple[str, str]] = set()
+    for a, k in zip(refs, keys):
+        if k in seen:
+            continue
+        seen.add(k)
+        all_articles.append(a)
+
+    # Return the num freshest articles (copied, see above)
+    return [dict(a) for a in heapq.nlargest(num, all_articles, key=lambda a: a.get("_ts", 0.0))]
+
+
+# Offline fixtures where the lxml fast path and feedparser must agree
+_PARSER_FIXTURES = {
+    "atom content only": b"""<?xml version="1.0"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>t</title>
+<entry><title>A</title><link href="http://e/a"/><id>a</id><updated>2024-01-02T10:00:00Z</updated>
+<content type="html">&lt;p&gt;Only content body.&lt;/p&gt;</content></entry>
+<entry><title>X</title><link href="http://e/x"/><id>x</id><updated>2024-01-02T10:00:00Z</updated>
+<content type="xhtml"><div xmlns="http://www.w3.org/1999/xhtml"><p>Xhtml body.</p></div></content></entry>
+</feed>""",
+    "rss script and content:encoded": b"""<?xml version="1.0"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/"><channel><title>c</title>
+<item><title>C</title><link>http://e/c</link><pubDate>Tue, 02 Jan 2024 10:00:00 GMT</pubDate>
+<description><![CDATA[Text<script>alert(1)</script> after]]></description></item>
+<item><title>B</title><link>http://e/b</link><pubDate>Tue, 02 Jan 2024 10:00:00 GMT</pubDate>
+<content:encoded><![CDATA[<p>Encoded <img src="http://i/b.png"> body</p>]]></content:encoded></item>
+</channel></rss>""",
+}
 
-    # Shuffle for freshness / variety
-    random.shuffle(all_articles)
 
-    # Return at most num
-    return all_articles[:num]
+def check_parsers():
+    """Offline check that the lxml fast path matches feedparser on _PARSER_FIXTURES."""
+    global etree
+    if etree is None:
+        print("lxml not installed; only the feedparser path is in use")
+        return
+    for name, body in _PARSER_FIXTURES.items():
+        fast = _parse_feed_lxml(body)
+        saved, etree = etree, None
+        try:
+            slow = _parse_feed_body(name, body)
+        finally:
+            etree = saved
+        assert fast == slow, f"{name}: lxml {fast!r} != feedparser {slow!r}"
+        print("ok:", name)
 
 
 def test_feeds():
@@ -221,4 +680,5 @@ def test_feeds():
 
 
 if __name__ == "__main__":
+    check_parsers()
     test_feeds()
@@ -14,13 +14,40 @@ if "health" in query_params:
 
 
 import time
+import html
+import asyncio
 import streamlit as st
 
+# optional uvloop event loop for the async feed fetcher (Linux/macOS only)
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except Exception:
+    pass
+
 from coordinator import generate_briefing
 from tools.rss_fetcher import SUPPORTED_CATEGORIES
 
 st.set_page_config(page_title="Daily News Briefing", layout="wide")
 
+PLACEHOLDER_IMG = "https://via.placeholder.com/400x225.png?text=No+Image"
+
+
+def _img_html(url: str) -> str:
+    """Lazy-loading <img> tag with placeholder fallback (URL is feed-supplied, so escape it)."""
+    src = html.escape(url, quote=True)
+    return (
+        f'<img src="{src}" loading="lazy" style="width:100%" '
+        f"onerror=\"this.onerror=null;this.src='{PLACEHOLDER_IMG}'\">"
+    )
+
+
+@st.cache_data(ttl=120, show_spinner=False)
+def _cached_briefing(cats_t: tuple, num: int) -> dict:
+    """generate_briefing memoized across reruns/sessions for the same (categories, count)."""
+    return generate_briefing(top_n=num, categories=list(cats_t))
+
+
 st.title("📰 Daily News Briefing Agent")
 st.caption(
     "Get real-time news, AI-powered summaries, and category-wise briefings — all in one dashboard."
@@ -53,7 +80,7 @@ if run_btn:
     else:
         start = time.time()
         with st.spinner("Generating briefing... (this may take a few seconds)"):
-            briefing = generate_briefing(top_n=num, categories=cats)
+            briefing = _cached_briefing(tuple(cats), int(num))
         elapsed = time.time() - start
 
         items = briefing.get("items", [])
@@ -74,19 +101,8 @@ if run_btn:
             for idx, it in enumerate(items, start=1):
                 cols = st.columns([1, 4])
                 with cols[0]:
-                    if it.get("image"):
-                        try:
-                            st.image(it["image"], caption="", use_container_width=True)
-                        except Exception:
-                            st.image(
-                                "https://via.placeholder.com/400x225.png?text=No+Image",
-                                use_container_width=True,
-                            )
-                    else:
-                        st.image(
-                            "https://via.placeholder.com/400x225.png?text=No+Image",
-                            use_container_width=True,
-                        )
+                    # browser loads images lazily; the server does no image I/O
+                    st.markdown(_img_html(it.get("image") or PLACEHOLDER_IMG), unsafe_allow_html=True)
                 with cols[1]:
                     st.markdown(f"**{idx}. {it.get('title', 'Untitled')}**")
                     st.markdown(
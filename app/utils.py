@@ -1,14 +1,57 @@
-# app/utils.py
 """
-Small utilities used by coordinator and CLI
+Small utilities shared across the app: article hashing and JSON (de)serialization
 """
 
 import hashlib
-from typing import Dict
+import json
+from typing import Any, BinaryIO, Dict
 
-def fingerprint_article(item: Dict) -> str:
+# optional fast JSON (orjson; falls back to stdlib json)
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+# optional fast non-cryptographic hashes, fastest first (falls back to 8-byte blake2b)
+try:
+    import xxhash
+except Exception:
+    xxhash = None
+try:
+    import mmh3
+except Exception:
+    mmh3 = None
+
+def key_hash(key: str) -> int:
+    """64-bit integer hash of a dedupe key; cheaper to store and compare than the string."""
+    data = key.encode("utf-8")
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(data)
+    if mmh3 is not None:
+        return mmh3.hash64(data, signed=False)[0]
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+
+def fingerprint_article(item: Dict) -> int:
     """
-    Create a stable fingerprint for an article based on title+url
+    Create a stable 64-bit integer fingerprint for an article based on title+url
     """
-    key = (item.get("title", "") + "|" + item.get("url", "")).encode("utf-8")
-    return hashlib.sha256(key).hexdigest()
+    return key_hash(item.get("title", "") + "|" + item.get("url", ""))
+
+def dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+    """UTF-8 JSON for obj (2-space indented if `indent`)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """JSON text for obj (2-space indented if `indent`)."""
+    return dumps_bytes(obj, indent).decode("utf-8")
+
+def dump_file(obj: Any, f: BinaryIO, indent: bool = False):
+    """Write obj as JSON to a file opened in binary mode."""
+    f.write(dumps_bytes(obj, indent))
+
+def load_file(f: BinaryIO) -> Any:
+    """Read JSON from a file opened in binary mode."""
+    data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
@@ -1,12 +1,33 @@
 from flask import Flask, render_template, request
 from app.coordinator import generate_briefing
 from datetime import datetime
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, Optional
 
 from flask import Flask, render_template, request, redirect, url_for
 from app.memory.memory_bank import load_memory, update_preferences
 from app.coordinator import generate_briefing
 
-app = Flask(__name__, template_folder="templates", static_folder="static")
+# optional uvloop event loop for the async feed fetcher (Linux/macOS only)
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except Exception:
+    pass
+
+app = Flask(__name__, template_folder="web/templates", static_folder="static")
+
+# briefings run off the request thread so one dead feed times out instead of hanging it
+# (production: gunicorn --pythonpath app -k gthread --threads 8 app.webapp:app, see Procfile)
+BRIEFING_WORKERS = 8
+BRIEFING_TIMEOUT = 5
+_EXECUTOR = ThreadPoolExecutor(max_workers=BRIEFING_WORKERS)
+# category -> briefing still running; requests for the same category share it
+# instead of queueing another, so leftover work never exceeds the worker count
+_INFLIGHT: Dict[str, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
 
 CATEGORIES = ["tech", "business", "sports", "health", "world"]
 
@@ -17,6 +38,25 @@ def datetimeformat(value):
     except Exception:
         return str(value)
 
+def _forget(category: str, future: Future):
+    with _INFLIGHT_LOCK:
+        if _INFLIGHT.get(category) is future:
+            del _INFLIGHT[category]
+
+def _briefing_future(category: str) -> Optional[Future]:
+    """Running (or new) briefing for `category`; None if every worker is still busy."""
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(category)
+        if future is not None:
+            return future
+        if len(_INFLIGHT) >= BRIEFING_WORKERS:
+            return None
+        future = _EXECUTOR.submit(generate_briefing, categories=[category])
+        _INFLIGHT[category] = future
+    # outside the lock: the callback runs inline if the briefing already finished
+    future.add_done_callback(lambda f: _forget(category, f))
+    return future
+
 @app.route("/")
 def index():
     return render_template("index.html", categories=CATEGORIES)
@@ -24,8 +64,11 @@ def index():
 @app.route("/feed")
 def feed():
     category = request.args.get("category", "tech")
-    briefing = generate_briefing(category=category)
-    return render_template("feed.html", category=category, briefing=briefing)
+    future = _briefing_future(category)
+    if future is None or not wait([future], timeout=BRIEFING_TIMEOUT).done:
+        # a running briefing keeps going and warms the feed caches for the next request
+        return render_template("feed.html", category=category, briefing={"items": []}, timed_out=True)
+    return render_template("feed.html", category=category, briefing=future.result(), timed_out=False)
 
 if __name__ == "__main__":
     app.run(debug=True)